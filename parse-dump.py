@@ -6,7 +6,8 @@ import yaml
 import re
 from src.search import SEARCH_MAPPING
 from src.dumblua import LuaLineTypes, LuaLineInterpretor
-from src.helpers import write_subkeys
+from src.helpers import write_subkeys, write_object, script_object_name
+from src.stream import iter_objects
 
 # Use this lib if desired to decode the b64encoded functions
 import base64
@@ -105,15 +106,8 @@ class DumpLoader:
             self.tables[cat] = _to_add
 
         for script in self.scripts:
-            # Grab a name for the file from the script name
-            # (pulled from the "-- =*=*=*=*=* {script} :: BEGIN SCRIPT DUMP *=*=*=*=*=" string)
-            script_obj_name = script
-            # If script follows the naming standard `Minigun [minigun]`, use the [object] name
-            if "[" in script and "]" in script:
-                script_obj_name = script.split("[")[1].split("]")[0].strip()
-                # The hardpoint has a blank object name for what the fuck ever, so just reset to scriptobj name
-                if script_obj_name == "":
-                    script_obj_name = script
+            # Grab a name for the file from the script name, see `src.helpers.script_object_name`
+            script_obj_name = script_object_name(script)
             self.script_tables[script_obj_name] = {}
             _script_content = self._file_contents.split(f"-- =*=*=*=*=* {script} :: BEGIN SCRIPT DUMP *=*=*=*=*=")[1] \
                 .split(f"-- =*=*=*=*=* {script} :: END SCRIPT DUMP *=*=*=*=*=")[0]
@@ -216,7 +210,7 @@ class DumpLoader:
         :return: None
         """
         self._file_contents = re.sub(
-            r"loadstring\(Base64dec\(\[\[\s(.+\n)+]]\n*\)\)",
+            r"loadstring\(Base64dec\(\[\[\s(.+\n)+?]]\n*\)\)",
             "%b64_encoded_function%",
             self._file_contents
         )
@@ -288,7 +282,37 @@ class DumpLoader:
         write_subkeys(_scripts, _map)
 
 
+def write_streamed_files(file_name: str, folder_name: str) -> None:
+    """
+    Writes the same per-object files as `DumpLoader.write_to_files`, but straight from `src.stream.iter_objects`,
+    so the dumps file is never loaded or parsed into memory as a whole. Use this for very large (i.e. modded) dumps.
+
+    The `complete_dump.yml` file is not written, as that needs the full tree.
+
+    :param file_name: the name of the High Seas Dumps file (in the format provided by Endo)
+    :param folder_name: the name of the output directory. WARNING: if this dir already exists, it will be deleted
+    in its entirety before being recreated.
+    :return: None
+    """
+    # The dumps file is only opened once iteration starts, which is after we've changed into the output dir
+    file_name = os.path.abspath(file_name)
+    if os.path.exists(folder_name):
+        shutil.rmtree(folder_name)
+    os.mkdir(folder_name)
+    os.chdir(folder_name)
+    for literal in SEARCH_MAPPING.keys():
+        os.mkdir(literal)
+
+    for literal, item_name, item in iter_objects(file_name, SEARCH_MAPPING.keys()):
+        os.chdir(literal)
+        write_object(item_name, item, SEARCH_MAPPING[literal])
+        os.chdir("..")
+
+
 def main():
+    if "--stream" in sys.argv[3:]:
+        write_streamed_files(sys.argv[1], sys.argv[2])
+        return
     loader = DumpLoader(sys.argv[1])
     loader.write_to_files(sys.argv[2])
     loader.write_to_file("complete_dump.yml")
@@ -296,7 +320,8 @@ def main():
 
 if __name__ == "__main__":
     if len(sys.argv) < 3:
-        print(f"Usage: {sys.argv[0]} dump_filename output_directory")
+        print(f"Usage: {sys.argv[0]} dump_filename output_directory [--stream]")
+        print("--stream: write the per-object files without loading the whole dump into memory")
         print(
             "WARNING: will first delete the given output directory if it already exists, so give a unique folder name!"
         )
@@ -44,12 +44,47 @@ def write_subkeys(_subdict: dict, searchmap: list) -> None:
             item_name = item["SaveName"]
         except KeyError:
             item_name = key
-        _item_dict = {item_name: {}}
-        for search_item in searchmap:
-            try:
-                _item_dict[item_name][search_item] = item[search_item]
-            except KeyError:
-                pass
-        with open(item_name + ".yml", 'w') as h:
-            h.write(yaml.safe_dump(_item_dict))
+        write_object(item_name, item, searchmap)
     os.chdir("..")
+
+
+def write_object(item_name: str, item: dict, searchmap: list) -> None:
+    """
+    Writes a single object's yaml file (`{item_name}.yml`) into the current directory.
+
+    Only the variables listed in the searchmap are copied out of the object, any that are missing are skipped.
+
+    :param item_name: the name of the object, used as both the top level yaml key and the file name
+    :param item: the parsed dict for this object
+    :param searchmap: the map of variables to copy out of the object dict into the yaml file
+    (specified in search.py)
+    :return: None
+    """
+    _item_dict = {item_name: {}}
+    for search_item in searchmap:
+        try:
+            _item_dict[item_name][search_item] = item[search_item]
+        except KeyError:
+            pass
+    with open(item_name + ".yml", 'w') as h:
+        h.write(yaml.safe_dump(_item_dict))
+
+
+def script_object_name(script: str) -> str:
+    """
+    Grabs a name for a script dump from its header name
+    (pulled from the "-- =*=*=*=*=* {script} :: BEGIN SCRIPT DUMP *=*=*=*=*=" string)
+
+    If the script follows the naming standard `Minigun [minigun]`, the [object] name is used, otherwise the
+    whole script name is.
+
+    :param script: the script name from the script dump header
+    :return: the name to key the script object by
+    """
+    script_obj_name = script
+    if "[" in script and "]" in script:
+        script_obj_name = script.split("[")[1].split("]")[0].strip()
+        # The hardpoint has a blank object name for what the fuck ever, so just reset to scriptobj name
+        if script_obj_name == "":
+            script_obj_name = script
+    return script_obj_name
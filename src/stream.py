@@ -0,0 +1,157 @@
+import re
+from typing import Iterable, Iterator, Tuple, Union
+from src.dumblua import LuaLineTypes, LuaLineInterpretor
+from src.helpers import script_object_name
+
+# The category name the script dumps are yielded under, matching the `SEARCH_MAPPING` key in `src/search.py`
+SCRIPTED = "SCRIPTED"
+
+B64_PLACEHOLDER = "%b64_encoded_function%"
+_B64_OPEN = "loadstring(Base64dec([["
+
+
+class _TableBuilder:
+    """
+    Incrementally builds the intermediate py dict for a single section of the dumps file, one
+    `src.dumblua.LuaLineInterpretor` token at a time.
+
+    Follows the same nesting and literal table rules as the script loop in `DumpLoader.__init__`, but keeps the
+    stack of open dicts directly instead of re-traversing table names from the root for every token.
+    """
+    def __init__(self, emit_entries: bool) -> None:
+        """
+        :param emit_entries: if true, every table directly inside a top-level table (i.e. `Materials[1]`) is handed
+        back from feed() as soon as it is closed and removed from its parent, so the section never holds more than
+        one object at a time.
+        """
+        self.root = {}
+        self._emit_entries = emit_entries
+        # Stack of (table name, table dict) for each currently open table, see `DumpLoader.__init__`
+        self._open_table = []
+        self._literal_table_counter = 0
+        self._last_line: Union[None, LuaLineInterpretor] = None
+
+    def _current(self) -> dict:
+        return self._open_table[-1][1] if self._open_table else self.root
+
+    def _open(self, table_name: str) -> None:
+        table = {}
+        self._current()[str(table_name)] = table
+        self._open_table.append((table_name, table))
+
+    def feed(self, lualine: LuaLineInterpretor) -> Union[None, Tuple[str, dict]]:
+        """
+        Applies a single line token to the intermediate dict.
+
+        :param lualine: the next line token of the section
+        :return: a (table name, table dict) pair if this token closed a top-level entry and emit_entries is set,
+        otherwise None
+        """
+        _entry = None
+        _last_line = self._last_line
+        self._last_line = lualine
+        if lualine.get_type() == LuaLineTypes.VAR_TABLE_ASSIGN:
+            self._open(lualine.table_name)
+        elif lualine.get_type() == LuaLineTypes.VAR_IMMEDIATE_TABLE_OPEN_CLOSE:
+            self._open_table.pop()
+        elif lualine.get_type() == LuaLineTypes.VAR_TABLE_OPEN:
+            # Catch nested literal tables without a var name, see `DumpLoader.__init__`
+            if _last_line is not None and (
+                    _last_line.get_type() == LuaLineTypes.VAR_TABLE_OPEN or
+                    _last_line.get_type() == LuaLineTypes.VAR_TABLE_CLOSE or
+                    (_last_line.get_type() == LuaLineTypes.VAR_TABLE_ASSIGN and
+                     _last_line.get_line().endswith("{"))):
+                self._open(f"literal_table_{self._literal_table_counter}")
+                self._literal_table_counter += 1
+        elif lualine.get_type() == LuaLineTypes.VAR_TABLE_CLOSE:
+            table_name, table = self._open_table.pop()
+            if self._emit_entries and len(self._open_table) == 1:
+                # Drop the finished entry from its parent so it can be freed once the caller is done with it
+                del self._open_table[-1][1][str(table_name)]
+                _entry = (str(table_name), table)
+        elif lualine.get_type() == LuaLineTypes.VAR_ASSIGN:
+            if "\"" in lualine.assign_value:
+                lualine.assign_value = lualine.assign_value.replace("\"", "")
+            if "\\\"" in lualine.assign_value:
+                lualine.assign_value = lualine.assign_value.replace("\\\"", "")
+            self._current()[lualine.var_name] = lualine.assign_type(lualine.assign_value)
+        return _entry
+
+
+def _iter_lines(handle) -> Iterator[str]:
+    """
+    Reads the dumps file line by line, collapsing each multiline `loadstring(Base64dec([[ ... ]]))` block into a
+    single line with the block replaced by B64_PLACEHOLDER. This is the streaming equivalent of
+    `DumpLoader.extract_b64_encoded_funcs`.
+
+    :param handle: an open text file handle of the dumps file
+    :return: an iterator over the lines of the file, without their trailing newlines
+    """
+    _prefix = None
+    for line in handle:
+        line = line.rstrip("\n")
+        if _prefix is not None:
+            if line.startswith("]]"):
+                yield _prefix + B64_PLACEHOLDER + re.sub(r"^]]\)\)", "", line)
+                _prefix = None
+        elif line.endswith(_B64_OPEN):
+            _prefix = line[:-len(_B64_OPEN)]
+        else:
+            yield line
+    if _prefix is not None:
+        yield _prefix + B64_PLACEHOLDER
+
+
+def iter_objects(
+        file_name: str,
+        categories: Union[None, Iterable[str]] = None
+) -> Iterator[Tuple[str, str, dict]]:
+    """
+    Streams the objects out of a High Seas dumps file without ever holding the whole parsed tree in memory.
+
+    Yields each top-level entry of a category dump (i.e. every material in `Materials`) as soon as its closing
+    '}' is read, and each script dump as soon as its END footer is read. Nothing is kept once the object has been
+    yielded, so memory use depends on the size of the largest single object, not on the size of the file.
+
+    As with `DumpLoader`, only the first dump of a repeated category or script is used. Unlike `DumpLoader`, different
+    scripts that share an [object] name are each yielded, rather than only the last one being kept.
+
+    :param file_name: the name of the High Seas Dumps file (in the format provided by Endo)
+    :param categories: the category names to yield objects for (i.e. "MATERIALS", "WEAPONS", or SCRIPTED for the
+    script dumps). If None, every category is yielded.
+    :return: an iterator of (category, name, object dict) tuples, where name is the object's SaveName if it has one,
+    otherwise its key in the dump (the [object] name for scripts, see `src.helpers.script_object_name`)
+    """
+    _wanted = None if categories is None else set(categories)
+    _seen = set()
+    _category = None
+    _script = None
+    _builder: Union[None, _TableBuilder] = None
+    with open(file_name, 'r') as h:
+        for line in _iter_lines(h):
+            if line.startswith("-- ========== BEGIN"):
+                cat = line.replace("-- ========== BEGIN", "").replace("DUMP ==========", "").strip()
+                if (cat, False) not in _seen and (_wanted is None or cat in _wanted):
+                    _seen.add((cat, False))
+                    _category = cat
+                    _builder = _TableBuilder(emit_entries=True)
+            elif line.startswith("-- ==========  END"):
+                _category = None
+                _builder = None
+            elif line.startswith("-- =*=*=*=*=*") and line.endswith(":: BEGIN SCRIPT DUMP *=*=*=*=*="):
+                script = line.replace("-- =*=*=*=*=*", "").replace(":: BEGIN SCRIPT DUMP *=*=*=*=*=", "").strip()
+                if (script, True) not in _seen and (_wanted is None or SCRIPTED in _wanted):
+                    _seen.add((script, True))
+                    _script = script
+                    _builder = _TableBuilder(emit_entries=False)
+            elif line.startswith("-- =*=*=*=*=*") and line.endswith(":: END SCRIPT DUMP *=*=*=*=*="):
+                if _script is not None:
+                    key = script_object_name(_script)
+                    yield SCRIPTED, _builder.root.get("SaveName", key), _builder.root
+                _script = None
+                _builder = None
+            elif _builder is not None:
+                _entry = _builder.feed(LuaLineInterpretor(line))
+                if _entry is not None:
+                    key, item = _entry
+                    yield _category, item.get("SaveName", key), item